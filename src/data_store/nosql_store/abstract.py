@@ -95,6 +95,58 @@ class NoSQLStore(abc.ABC):
             **kwargs,
         )
 
+    def find_one(
+        self,
+        collection: str,
+        filters: dict | None = None,
+        projections: list[str] | None = None,
+        *args,
+        **kwargs,
+    ) -> dict | None:
+        """Find the first document matching the query
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for any document
+            projections (list[str] | None): Fields to include in result, default is None
+
+        Returns:
+            dict | None: First matching document, or None if nothing matches
+
+        Raises:
+            ValueError: If collection name is empty
+
+        Examples:
+            >>> result = store.find_one("collection", filters={"field": "value"}, projections=["field1"])
+        """
+        return self._find_one(
+            collection=collection,
+            filters=filters,
+            projections=projections,
+            *args,
+            **kwargs,
+        )
+
+    def count(
+        self, collection: str, filters: dict | None = None, *args, **kwargs
+    ) -> int:
+        """Count documents in a collection
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for count all
+
+        Returns:
+            int: Number of documents matching the query
+
+        Raises:
+            ValueError: If collection name is empty
+
+        Examples:
+            >>> total = store.count("collection", filters={"field": "value"})
+        """
+        return self._count(collection=collection, filters=filters, *args, **kwargs)
+
     def update(
         self,
         collection: str,
@@ -144,12 +196,25 @@ class NoSQLStore(abc.ABC):
         """
         return self._delete(collection=collection, filters=filters, *args, **kwargs)
 
-    def bulk_insert(self, collection: str, data: list[dict], *args, **kwargs) -> str:
+    def bulk_insert(
+        self,
+        collection: str,
+        data: list[dict],
+        ordered: bool = False,
+        write_concern: dict | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
         """Insert multiple documents into a collection
 
         Args:
             collection (str): Name of the collection to insert into
             data (list[dict]): List of documents to insert
+            ordered (bool): Insert documents in order and stop at the first error,
+                default False
+            write_concern (dict | None): Write concern for this insert, e.g.
+                {"w": 0} to skip waiting for the server's acknowledgement,
+                default None uses the collection's write concern
 
         Returns:
             str: String representation of count of inserted documents
@@ -158,7 +223,14 @@ class NoSQLStore(abc.ABC):
             ValueError: If collection name is empty or data is None
             RuntimeError: If database operation fails
         """
-        return self._bulk_insert(collection=collection, data=data, *args, **kwargs)
+        return self._bulk_insert(
+            collection=collection,
+            data=data,
+            ordered=ordered,
+            write_concern=write_concern,
+            *args,
+            **kwargs,
+        )
 
     def bulk_update(
         self,
@@ -213,6 +285,44 @@ class NoSQLStore(abc.ABC):
             collection=collection, filters=filters, *args, **kwargs
         )
 
+    def bulk_write(
+        self, collection: str, operations: list, ordered: bool = True, *args, **kwargs
+    ) -> dict[str, int]:
+        """Apply a batch of mixed write operations to a collection in one round trip
+
+        Args:
+            collection (str): Name of the collection to write to
+            operations (list): Backend write operations to apply
+            ordered (bool): Apply operations in order and stop at the first error,
+                default True
+
+        Returns:
+            dict[str, int]: Inserted, matched, modified, deleted and upserted counts
+
+        Raises:
+            ValueError: If collection name is empty or operations are None
+            RuntimeError: If database operation fails
+        """
+        return self._bulk_write(
+            collection=collection,
+            operations=operations,
+            ordered=ordered,
+            *args,
+            **kwargs,
+        )
+
+    def drop_collection(self, collection: str, *args, **kwargs) -> None:
+        """Drop a collection and all of its documents
+
+        Args:
+            collection (str): Name of the collection to drop
+
+        Raises:
+            ValueError: If collection name is empty
+            RuntimeError: If database operation fails
+        """
+        return self._drop_collection(collection=collection, *args, **kwargs)
+
     @abc.abstractmethod
     def _connect(self, *args, **kwargs):
         """Abstract method to establish database connection
@@ -279,6 +389,48 @@ class NoSQLStore(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _find_one(
+        self,
+        collection: str,
+        filters: dict | None = None,
+        projections: list[str] | None = None,
+        *args,
+        **kwargs,
+    ) -> dict | None:
+        """Abstract method to find the first matching document
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for any document
+            projections (list[str] | None): Fields to include in result, default is None
+
+        Returns:
+            dict | None: First matching document, or None if nothing matches
+
+        Raises:
+            ValueError: If collection name is empty
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _count(
+        self, collection: str, filters: dict | None = None, *args, **kwargs
+    ) -> int:
+        """Abstract method to count documents
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for count all
+
+        Returns:
+            int: Number of documents matching the query
+
+        Raises:
+            ValueError: If collection name is empty
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _update(
         self,
@@ -324,12 +476,24 @@ class NoSQLStore(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def _bulk_insert(self, collection: str, data: list[dict], *args, **kwargs) -> str:
+    def _bulk_insert(
+        self,
+        collection: str,
+        data: list[dict],
+        ordered: bool = False,
+        write_concern: dict | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
         """Abstract method to bulk insert documents
 
         Args:
             collection (str): Name of the collection to insert into
             data (list[dict]): List of documents to insert
+            ordered (bool): Insert documents in order and stop at the first error,
+                default False
+            write_concern (dict | None): Write concern for this insert,
+                default None uses the collection's write concern
 
         Returns:
             str: String representation of count of inserted documents
@@ -386,6 +550,40 @@ class NoSQLStore(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _bulk_write(
+        self, collection: str, operations: list, ordered: bool = True, *args, **kwargs
+    ) -> dict[str, int]:
+        """Abstract method to apply a batch of mixed write operations
+
+        Args:
+            collection (str): Name of the collection to write to
+            operations (list): Backend write operations to apply
+            ordered (bool): Apply operations in order and stop at the first error,
+                default True
+
+        Returns:
+            dict[str, int]: Inserted, matched, modified, deleted and upserted counts
+
+        Raises:
+            ValueError: If collection name is empty or operations are None
+            RuntimeError: If database operation fails
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _drop_collection(self, collection: str, *args, **kwargs) -> None:
+        """Abstract method to drop a collection
+
+        Args:
+            collection (str): Name of the collection to drop
+
+        Raises:
+            ValueError: If collection name is empty
+            RuntimeError: If database operation fails
+        """
+        raise NotImplementedError
+
 
 class NoSQLStoreComponentFactory(abc.ABC):
     def __init__(
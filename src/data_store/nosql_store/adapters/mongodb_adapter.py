@@ -1,5 +1,6 @@
 import functools
 import logging
+import threading
 from typing import Any, Callable, TypeVar
 
 import bson
@@ -58,10 +59,19 @@ def validate_not_none(
 
 
 class NoSQLStore(abstract.NoSQLStore):
-    """MongoDB implementation of NoSQL store"""
+    """MongoDB implementation of NoSQL store
+
+    Stores connecting with the same URI and timeout share one pymongo.MongoClient,
+    which already pools connections. The shared client is reference counted and
+    only closed once the last store using it is closed.
+    """
 
     config: configurations.NoSQLConfiguration
 
+    _client_cache: dict[tuple[str, float], pymongo.MongoClient] = {}
+    _client_refs: dict[tuple[str, float], int] = {}
+    _client_lock = threading.Lock()
+
     def __init__(
         self,
         config: dict[str, Any] | configurations.NoSQLConfiguration,
@@ -70,10 +80,15 @@ class NoSQLStore(abstract.NoSQLStore):
     ) -> None:
         super().__init__(config)
         self._client: pymongo.MongoClient | None = None
+        self._client_key: tuple[str, float] | None = None
         self._database: pymongo.database.Database | None = None
 
     def _init_client(self, *args, **kwargs) -> pymongo.MongoClient:
         """Initialize MongoDB client using connection configuration
+        connection_timeout bounds both server selection and each TCP connect
+        attempt, so connectTimeoutMS follows it (30 seconds by default)
+        instead of pymongo's own 20 second default.
+
         Attributes:
             kwargs(dict): Additional keyword arguments for pymongo.MongoClient
         Returns:
@@ -85,11 +100,12 @@ class NoSQLStore(abstract.NoSQLStore):
         """
         connection_config = self.config.connection
         connection_uri = connection_config.connection_uri
-        connection_timeout = connection_config.connection_timeout
+        timeout_ms = int(connection_config.connection_timeout * 1000)
 
         client = pymongo.MongoClient(
             connection_uri,
-            serverSelectionTimeoutMS=connection_timeout * 1000,
+            serverSelectionTimeoutMS=timeout_ms,
+            connectTimeoutMS=timeout_ms,
             **kwargs,
         )
 
@@ -99,12 +115,14 @@ class NoSQLStore(abstract.NoSQLStore):
             logger.info("Successfully connected to MongoDB")
         except pymongo.errors.ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
+            client.close()
             raise RuntimeError(
                 "Failed to connect to MongoDB. Check your connection settings."
                 f" Error: {e}"
             ) from e
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
+            client.close()
             raise
 
         return client
@@ -148,10 +166,15 @@ class NoSQLStore(abstract.NoSQLStore):
         database = self._get_database()
         return database[collection]
 
-    def _connect(self, *args, **kwargs):
+    def _connect(self, *args, force_new: bool = False, **kwargs):
         """Establish database connection
 
+        Reuses the client shared by stores with the same connection settings
+        unless ``force_new`` is set or extra client options are given.
+
         Attributes:
+            force_new (bool): Keyword-only, always create a dedicated client,
+                default False
             **kwargs (dict): Additional keyword arguments for pymongo.MongoClient
 
         Returns:
@@ -160,21 +183,60 @@ class NoSQLStore(abstract.NoSQLStore):
         Raises:
             RuntimeError: If connection establishment fails
         """
-        if not self._client:
+        if self._client:
+            return self._client
+
+        if force_new or kwargs:
             self._client = self._init_client(*args, **kwargs)
+            return self._client
+
+        connection_config = self.config.connection
+        key = (connection_config.connection_uri, connection_config.connection_timeout)
+        with self._client_lock:
+            client = self._client_cache.get(key)
+            if client is not None:
+                self._client_refs[key] += 1
+
+        if client is None:
+            # Build and ping outside the lock, a slow or unreachable server
+            # must not block stores connecting to other URIs
+            new_client = self._init_client(*args, **kwargs)
+            with self._client_lock:
+                client = self._client_cache.setdefault(key, new_client)
+                self._client_refs[key] = self._client_refs.get(key, 0) + 1
+            if client is not new_client:
+                # Another store cached a client for this key in the meantime
+                new_client.close()
+
+        self._client = client
+        self._client_key = key
         return self._client
 
     def _close(self):
         """Close connection
 
+        A shared client is only closed once no other store is using it.
+
         Raises:
             RuntimeError: If connection closure fails
         """
-        if self._client:
+        if not self._client:
+            return
+
+        key = self._client_key
+        if key is None:
             self._client.close()
-            self._client = None
-            self._database = None
-            logger.info("MongoDB connection closed")
+        else:
+            with self._client_lock:
+                self._client_refs[key] -= 1
+                if self._client_refs[key] <= 0:
+                    del self._client_refs[key]
+                    self._client_cache.pop(key).close()
+
+        self._client = None
+        self._client_key = None
+        self._database = None
+        logger.info("MongoDB connection closed")
 
     @validate_not_none("collection", "data")
     def _insert(self, collection: str, data: dict, *args, **kwargs) -> str:
@@ -255,6 +317,66 @@ class NoSQLStore(abstract.NoSQLStore):
 
         return documents
 
+    @validate_not_none("collection")
+    def _find_one(
+        self,
+        collection: str,
+        filters: dict | None = None,
+        projections: list[str] | None = None,
+        *args,
+        **kwargs,
+    ) -> dict | None:
+        """Find the first document matching the query
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for any document
+            projections (list[str] | None): Fields to include in result, default is None
+            *args: Additional positional arguments for pymongo find_one
+            **kwargs: Additional keyword arguments for pymongo find_one
+
+        Returns:
+            dict | None: First matching document, or None if nothing matches
+
+        Raises:
+            ValueError: If collection name is empty
+        """
+        _collection = self._get_collection(collection)
+
+        # Build projection dict from list
+        projection_dict = None
+        if projections:
+            projection_dict = {field: 1 for field in projections}
+
+        document = _collection.find_one(filters or {}, projection_dict, *args, **kwargs)
+
+        # Convert ObjectId to string for JSON serialization
+        if document and isinstance(document.get("_id"), bson.ObjectId):
+            document["_id"] = str(document["_id"])
+
+        return document
+
+    @validate_not_none("collection")
+    def _count(
+        self, collection: str, filters: dict | None = None, *args, **kwargs
+    ) -> int:
+        """Count documents in a collection
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for count all
+            *args: Additional positional arguments for pymongo count_documents
+            **kwargs: Additional keyword arguments for pymongo count_documents
+
+        Returns:
+            int: Number of documents matching the query
+
+        Raises:
+            ValueError: If collection name is empty
+        """
+        _collection = self._get_collection(collection)
+        return _collection.count_documents(filters or {}, *args, **kwargs)
+
     @validate_not_none("collection", "filters", "update_data")
     def _update(
         self,
@@ -311,12 +433,25 @@ class NoSQLStore(abstract.NoSQLStore):
         return result.deleted_count
 
     @validate_not_none("collection", "data")
-    def _bulk_insert(self, collection: str, data: list[dict], *args, **kwargs) -> str:
+    def _bulk_insert(
+        self,
+        collection: str,
+        data: list[dict],
+        ordered: bool = False,
+        write_concern: dict | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
         """Insert multiple documents into a collection
 
         Args:
             collection (str): Name of the collection to insert into
             data (list[dict]): List of documents to insert
+            ordered (bool): Insert documents in order and stop at the first error,
+                default False lets the server continue past failed documents
+            write_concern (dict | None): Keyword arguments for pymongo.WriteConcern,
+                e.g. {"w": 0} for unacknowledged writes, default None uses the
+                collection's write concern
 
         Returns:
             str: String representation of count of inserted documents
@@ -327,7 +462,11 @@ class NoSQLStore(abstract.NoSQLStore):
         """
 
         _collection = self._get_collection(collection)
-        result = _collection.insert_many(data, *args, **kwargs)
+        if write_concern is not None:
+            _collection = _collection.with_options(
+                write_concern=pymongo.WriteConcern(**write_concern)
+            )
+        result = _collection.insert_many(data, ordered, *args, **kwargs)
         return f"{len(result.inserted_ids)}"
 
     @validate_not_none("collection", "filters", "update_data")
@@ -382,7 +521,8 @@ class NoSQLStore(abstract.NoSQLStore):
 
         Args:
             collection (str): Name of the collection to delete from
-            filters (dict | list): Query filter(s) to select documents
+            filters (dict | list): Query filter(s) to select documents. A list of
+                filters is combined with ``$or`` and deleted in a single round trip
 
         Returns:
             int: Total number of documents deleted
@@ -392,21 +532,83 @@ class NoSQLStore(abstract.NoSQLStore):
             RuntimeError: If database operation fails
         """
         _collection = self._get_collection(collection)
-        total_deleted = 0
 
         if isinstance(filters, dict):
             # Single filter for all documents
-            result = _collection.delete_many(filters, *args, **kwargs)
-            total_deleted = result.deleted_count
+            query = filters
         elif isinstance(filters, list):
-            # Multiple filters
-            for filter_doc in filters:
-                result = _collection.delete_many(filter_doc, *args, **kwargs)
-                total_deleted += result.deleted_count
+            # Multiple filters, match documents selected by any of them
+            if not filters:
+                return 0
+            query = {"$or": filters}
         else:
             raise ValueError("Filters must be dict or list of dicts")
 
-        return total_deleted
+        result = _collection.delete_many(query, *args, **kwargs)
+        return result.deleted_count
+
+    @validate_not_none("collection")
+    def _bulk_write(
+        self, collection: str, operations: list, ordered: bool = True, *args, **kwargs
+    ) -> dict[str, int]:
+        """Apply a batch of mixed write operations to a collection
+
+        Args:
+            collection (str): Name of the collection to write to
+            operations (list): pymongo request objects (InsertOne, UpdateOne,
+                DeleteMany, ...) sent to the server in a single bulk_write call.
+                An empty list returns zero counts without a round trip
+            ordered (bool): Apply operations in order and stop at the first error,
+                default True
+            *args: Additional positional arguments for pymongo bulk_write
+            **kwargs: Additional keyword arguments for pymongo bulk_write
+
+        Returns:
+            dict[str, int]: Inserted, matched, modified, deleted and upserted counts
+
+        Raises:
+            ValueError: If collection name is empty or operations are None
+            RuntimeError: If database operation fails
+        """
+        if operations is None:
+            raise ValueError("operations cannot be None for _bulk_write operation")
+        if not operations:
+            # Nothing to send, pymongo itself rejects an empty batch
+            return {
+                "inserted_count": 0,
+                "matched_count": 0,
+                "modified_count": 0,
+                "deleted_count": 0,
+                "upserted_count": 0,
+            }
+        _collection = self._get_collection(collection)
+        result = _collection.bulk_write(operations, ordered, *args, **kwargs)
+        return {
+            "inserted_count": result.inserted_count,
+            "matched_count": result.matched_count,
+            "modified_count": result.modified_count,
+            "deleted_count": result.deleted_count,
+            "upserted_count": result.upserted_count,
+        }
+
+    @validate_not_none("collection")
+    def _drop_collection(self, collection: str, *args, **kwargs) -> None:
+        """Drop a collection and all of its documents
+
+        Dropping is a single metadata operation on the server, unlike
+        ``bulk_delete(collection, {})`` which removes documents one by one.
+
+        Args:
+            collection (str): Name of the collection to drop
+            *args: Additional positional arguments for pymongo drop_collection
+            **kwargs: Additional keyword arguments for pymongo drop_collection
+
+        Raises:
+            ValueError: If collection name is empty
+            RuntimeError: If database operation fails
+        """
+        database = self._get_database()
+        database.drop_collection(collection, *args, **kwargs)
 
 
 class NoSQLStoreComponentFactory(abstract.NoSQLStoreComponentFactory):
@@ -38,9 +38,9 @@ class NoSQLConnection(pdt.BaseModel):
     ssl: bool | None = pdt.Field(
         default=False, description="Enable SSL/TLS connection encryption."
     )
-    connection_timeout: int = pdt.Field(
+    connection_timeout: float = pdt.Field(
         default=30,
-        description="Connection timeout in seconds. Default is 30 seconds.",
+        description="Connection timeout in seconds, fractions allowed. Default is 30 seconds.",
     )
 
     @pdt.model_validator(mode="after")
@@ -25,6 +25,7 @@ class NoSQLStore:
 
         self.config = configurations.NoSQLConfiguration(**config)
         self.component_factory = self._init_component_factory()
+        self._connections = 0
 
     @property
     def client(self) -> abstract.NoSQLStore:
@@ -33,6 +34,11 @@ class NoSQLStore:
             self._client = self.component_factory.create_client()
         return self._client
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the store has an open connection"""
+        return self._connections > 0
+
     @contextlib.contextmanager
     def connect(self, *args, **kwargs):
         """Return a context manager for automatic connection lifecycle management
@@ -43,20 +49,33 @@ class NoSQLStore:
                 store.insert("collection", data)
                 # Connection is automatically closed on exit
 
+        Connecting a store that is already connected, for example nesting
+        ``connect()`` calls or sharing one connected store between callers,
+        reuses the open connection. It stays open until the outermost owner
+        closes it.
+
         Returns:
             ConnectionContext: Context manager that handles connection lifecycle
         """
         # return ConnectionContext(self)
         self._connect(*args, **kwargs)
-        yield self
-        self._close()
+        try:
+            yield self
+        finally:
+            self._close()
 
     def _connect(self, *args, **kwargs):
-        """Establish database connection"""
-        return self.client.connect(*args, **kwargs)
+        """Establish database connection, or reuse the one already open"""
+        connection = self.client.connect(*args, **kwargs)
+        self._connections += 1
+        return connection
 
     def _close(self, *args, **kwargs):
-        """Close database connection"""
+        """Close database connection once its last user has closed it"""
+        if self._connections > 1:
+            self._connections -= 1
+            return None
+        self._connections = 0
         return self.client.close(*args, **kwargs)
 
     def insert(self, collection: str, data: dict, *args, **kwargs) -> str:
@@ -118,6 +137,58 @@ class NoSQLStore:
             **kwargs,
         )
 
+    def find_one(
+        self,
+        collection: str,
+        filters: dict | None = None,
+        projections: list[str] | None = None,
+        *args,
+        **kwargs,
+    ) -> dict | None:
+        """Find the first document matching the query
+
+        The server stops at the first match instead of returning every
+        matching document.
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for any document
+            projections (list[str] | None): Fields to include in result, default is None
+
+        Returns:
+            dict | None: First matching document, or None if nothing matches
+
+        Raises:
+            ValueError: If collection name is empty
+
+        Examples:
+            >>> user = store.find_one("users", filters={"name": "John"}, projections=["age"])
+        """
+        return self.client.find_one(collection, filters, projections, *args, **kwargs)
+
+    def count(
+        self, collection: str, filters: dict | None = None, *args, **kwargs
+    ) -> int:
+        """Count documents in a collection
+
+        Counting runs on the server, so only the number is sent back instead
+        of every matching document.
+
+        Args:
+            collection (str): Collection name
+            filters (dict | None): Query filters, default is None for count all
+
+        Returns:
+            int: Number of documents matching the query
+
+        Raises:
+            ValueError: If collection name is empty
+
+        Examples:
+            >>> active_users = store.count("users", {"status": "active"})
+        """
+        return self.client.count(collection, filters, *args, **kwargs)
+
     def update(
         self,
         collection: str,
@@ -173,12 +244,25 @@ class NoSQLStore:
         """
         return self.client.delete(collection, filters, *args, **kwargs)
 
-    def bulk_insert(self, collection: str, data: list[dict], *args, **kwargs) -> str:
+    def bulk_insert(
+        self,
+        collection: str,
+        data: list[dict],
+        ordered: bool = False,
+        write_concern: dict | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
         """Insert multiple documents into a collection
 
         Args:
             collection (str): Name of the collection to insert into
             data (list[dict]): List of documents to insert
+            ordered (bool): Insert documents in order and stop at the first error,
+                default False lets the server insert them in parallel
+            write_concern (dict | None): Write concern for this insert, e.g.
+                {"w": 0} to skip waiting for the server's acknowledgement,
+                default None uses the collection's write concern
 
         Returns:
             str: String representation of count of inserted documents
@@ -189,8 +273,11 @@ class NoSQLStore:
 
         Examples:
             >>> result = store.bulk_insert("users", [{"name": "John"}, {"name": "Jane"}])
+            >>> store.bulk_insert("events", events, write_concern={"w": 0})
         """
-        return self.client.bulk_insert(collection, data, *args, **kwargs)
+        return self.client.bulk_insert(
+            collection, data, ordered, write_concern, *args, **kwargs
+        )
 
     def bulk_update(
         self,
@@ -250,6 +337,55 @@ class NoSQLStore:
         """
         return self.client.bulk_delete(collection, filters, *args, **kwargs)
 
+    def bulk_write(
+        self, collection: str, operations: list, ordered: bool = True, *args, **kwargs
+    ) -> dict[str, int]:
+        """Apply a batch of mixed write operations to a collection in one round trip
+
+        Args:
+            collection (str): Name of the collection to write to
+            operations (list): Backend write operations to apply, for MongoDB
+                pymongo request objects such as InsertOne, UpdateOne and DeleteMany
+            ordered (bool): Apply operations in order and stop at the first error,
+                default True
+
+        Returns:
+            dict[str, int]: Inserted, matched, modified, deleted and upserted counts
+
+        Raises:
+            ValueError: If collection name is empty or operations are None
+            RuntimeError: If database operation fails
+
+        Examples:
+            >>> from pymongo import DeleteMany, InsertOne, UpdateOne
+            >>> result = store.bulk_write(
+            ...     "users",
+            ...     [
+            ...         InsertOne({"name": "John", "status": "pending"}),
+            ...         UpdateOne({"name": "John"}, {"$set": {"status": "active"}}),
+            ...         DeleteMany({"status": "inactive"}),
+            ...     ],
+            ... )
+            >>> result["modified_count"]
+            1
+        """
+        return self.client.bulk_write(collection, operations, ordered, *args, **kwargs)
+
+    def drop_collection(self, collection: str, *args, **kwargs) -> None:
+        """Drop a collection and all of its documents
+
+        Args:
+            collection (str): Name of the collection to drop
+
+        Raises:
+            ValueError: If collection name is empty
+            RuntimeError: If database operation fails
+
+        Examples:
+            >>> store.drop_collection("users")
+        """
+        return self.client.drop_collection(collection, *args, **kwargs)
+
     def _init_component_factory(
         self, *args, **kwargs
     ) -> abstract.NoSQLStoreComponentFactory:
@@ -94,6 +94,17 @@ class ObjectStoreClient(abc.ABC):
         s3_object = self._get_object(key=key, bucket=bucket, *args, **kwargs)
         return s3_object
 
+    def stat_object(
+        self,
+        key: str,
+        bucket: str = None,
+        *args,
+        **kwargs,
+    ):
+        bucket = bucket or self.root_bucket
+        metadata = self._stat_object(key=key, bucket=bucket, *args, **kwargs)
+        return metadata
+
     def list_objects(
         self,
         bucket: str = None,
@@ -183,6 +194,10 @@ class ObjectStoreClient(abc.ABC):
     def _get_object(self, key: str, bucket: str, *args, **kwargs):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _stat_object(self, key: str, bucket: str, *args, **kwargs):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _upload_object(
         self,
@@ -1,5 +1,7 @@
 import io
+import os
 import tempfile
+import threading
 from typing import Any, Generator, Optional
 import datetime
 
@@ -8,7 +10,6 @@ import minio.commonconfig
 import minio.datatypes
 import urllib3.response
 import utils
-from icecream import ic
 
 from data_store.object_store import abstract, configurations, models
 
@@ -21,6 +22,7 @@ def create_object_metadata(
         key=minio_object._object_name,
         updated_time=minio_object._last_modified,
         size=minio_object._size,
+        etag=minio_object.etag,
     )
     return metadata
 
@@ -37,8 +39,19 @@ def create_object(
 
 
 class ObjectStoreClient(abstract.ObjectStoreClient):
+    """MinIO implementation of object store client
+
+    Clients connecting with the same endpoint and credentials share one
+    minio.Minio, so its signer state and keep-alive HTTP pool are reused
+    across ObjectStore instances in a process. The cache is keyed on the
+    process id as well, so a forked process never reuses its parent's pool.
+    """
+
     config: configurations.ObjectStoreConfiguration
 
+    _client_cache: dict[tuple[int, str, str, str, bool], minio.Minio] = {}
+    _client_lock = threading.Lock()
+
     def __init__(
         self,
         config: dict[str, Any] | configurations.ObjectStoreConfiguration,
@@ -48,12 +61,23 @@ class ObjectStoreClient(abstract.ObjectStoreClient):
 
     def _init_client(self) -> minio.Minio:
         connection_config = self.config.connection
-        client = minio.Minio(
-            endpoint=connection_config.endpoint,
-            access_key=connection_config.access_key,
-            secret_key=connection_config.secret_key,
-            secure=connection_config.secure,
+        key = (
+            os.getpid(),
+            connection_config.endpoint,
+            connection_config.access_key,
+            connection_config.secret_key,
+            connection_config.secure,
         )
+        with self._client_lock:
+            client = self._client_cache.get(key)
+            if client is None:
+                client = minio.Minio(
+                    endpoint=connection_config.endpoint,
+                    access_key=connection_config.access_key,
+                    secret_key=connection_config.secret_key,
+                    secure=connection_config.secure,
+                )
+                self._client_cache[key] = client
         return client
 
     def _list_buckets(self) -> Generator[models.Bucket, None, None]:
@@ -116,6 +140,12 @@ class ObjectStoreClient(abstract.ObjectStoreClient):
                 response.close()
                 response.release_conn()
 
+    def _stat_object(self, key: str, bucket: str, *args, **kwargs):
+        minio_object = self._client.stat_object(
+            bucket_name=bucket, object_name=key, *args, **kwargs
+        )
+        return create_object_metadata(minio_object=minio_object)
+
     def _upload_object(
         self,
         file_path: str,
@@ -18,6 +18,7 @@ class ObjectMetadata:
     key: str
     updated_time: datetime
     size: int
+    etag: str | None = None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1,9 +1,10 @@
 import logging
+import threading
+import time
 from collections.abc import Generator
 from typing import Any
 
 import utils
-from icecream import ic
 
 __all__ = ["ObjectStore"]
 from data_store.object_store import abstract, adapters, configurations, models
@@ -12,6 +13,9 @@ logger = logging.getLogger(__file__)
 
 DEFAULT_S3_FRAMEWORK = "minio"
 
+# Most presigned download URLs kept per store before the cache is reset
+PRESIGNED_URL_CACHE_SIZE = 1024
+
 
 class ObjectStore:
     config: configurations.ObjectStoreConfiguration
@@ -26,6 +30,8 @@ class ObjectStore:
         self.config = configurations.ObjectStoreConfiguration(**config)
         self.root_bucket = self.config.root_bucket
         self.component_factory = self.__init_component_factory()
+        self._presigned_urls: dict[tuple, tuple[int, str]] = {}
+        self._presigned_urls_lock = threading.Lock()
 
     @property
     def client(self) -> abstract.ObjectStoreClient:
@@ -164,6 +170,20 @@ class ObjectStore:
             **kwargs,
         )
 
+    def stat_object(
+        self,
+        key: str,
+        bucket: str = None,
+        *args,
+        **kwargs,
+    ) -> models.ObjectMetadata:
+        return self.client.stat_object(
+            key=key,
+            bucket=bucket,
+            *args,
+            **kwargs,
+        )
+
     def list_objects(
         self,
         prefix: str = "",
@@ -251,6 +271,12 @@ class ObjectStore:
     ) -> str:
         """Generate a presigned URL for downloading objects (GET method).
 
+        Repeated calls for the same key, bucket and expiry reuse the URL signed
+        earlier in the same half of the expiry period, so a returned URL is
+        always valid for at least ``expires / 2`` seconds. Calls with extra
+        arguments are always signed anew. The cache is guarded by a lock, so a
+        store can be shared between threads.
+
         Args:
             key (str): Object key name
             bucket (str, optional): Bucket name. Defaults to root_bucket
@@ -264,7 +290,22 @@ class ObjectStore:
             >>> print(url)
             "https://minio.example.com/bucket/file.txt?X-Amz-Algorithm=..."
         """
-        return self.client.get_presigned_url(key, bucket, expires, *args, **kwargs)
+        if args or kwargs:
+            return self.client.get_presigned_url(key, bucket, expires, *args, **kwargs)
+
+        window = int(time.time() // max(expires // 2, 1))
+        cache_key = (bucket, key, expires)
+        with self._presigned_urls_lock:
+            cached = self._presigned_urls.get(cache_key)
+        if cached is not None and cached[0] == window:
+            return cached[1]
+
+        url = self.client.get_presigned_url(key, bucket, expires)
+        with self._presigned_urls_lock:
+            if len(self._presigned_urls) >= PRESIGNED_URL_CACHE_SIZE:
+                self._presigned_urls.clear()
+            self._presigned_urls[cache_key] = (window, url)
+        return url
 
     def get_presigned_upload_url(
         self,
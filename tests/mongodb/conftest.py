@@ -1,5 +1,6 @@
 """MongoDB-specific fixtures for tests."""
 
+import pymongo.errors
 import pytest
 import utils
 
@@ -7,17 +8,65 @@ from data_store.nosql_store.nosql_store import NoSQLStore
 
 TEST_COLLECTION = "test_collection_e2e"
 
+logger = utils.get_logger(__name__)
 
-@pytest.fixture
-def mongodb_store():
-    """Create a NoSQLStore instance for MongoDB testing."""
+
+@pytest.fixture(scope="session")
+def nosql_config() -> dict:
+    """Load the ``nosql_store`` configuration once per test session.
+
+    The returned dict is shared between tests, copy it before modifying.
+    """
     config = utils.get_config().get("nosql_store")
-    store: NoSQLStore = NoSQLStore(config=config)
-    store._connect()
-    store.bulk_delete(TEST_COLLECTION, {})  # Clear the collection before tests
+    if config is None:
+        pytest.skip("NoSQL configuration not found")
+    return config
+
 
+@pytest.fixture(scope="session")
+def collection_name(worker_id) -> str:
+    """Name the shared test collection per pytest-xdist worker.
+
+    Each worker gets its own collection so ``pytest -n auto`` runs don't
+    clean up or count each other's documents.
+    """
+    return f"{TEST_COLLECTION}_{worker_id}"
+
+
+@pytest.fixture(scope="session")
+def _shared_store(nosql_config):
+    """Connect a single NoSQLStore for the whole test session."""
+    store = NoSQLStore(config=nosql_config)
+    store._connect()
     yield store
     store._close()
-    store.bulk_delete(
-        TEST_COLLECTION, {}
-    )  # cheat because delete filters must not be empty
+
+
+@pytest.fixture(scope="session")
+def _clean_collection(_shared_store, collection_name) -> str:
+    """Drop the test collection once, before the first test uses it.
+
+    Every test empties the collection on teardown, so later tests start
+    from a clean collection without a pre-test round trip. The collection
+    itself lives for the whole session rather than being recreated per test.
+    """
+    _shared_store.drop_collection(collection_name)
+    return collection_name
+
+
+@pytest.fixture
+def mongodb_store(_shared_store, _clean_collection):
+    """Provide the shared NoSQLStore with a clean test collection."""
+    yield _shared_store
+    _safe_cleanup(_shared_store, _clean_collection)
+
+
+def _safe_cleanup(store: NoSQLStore, collection: str):
+    """Safely cleanup collection with error handling."""
+    try:
+        # Keep the collection itself so it is created once per session
+        deleted_count = store.bulk_delete(collection, {})
+        logger.debug(f"Cleaned {deleted_count} documents from {collection}")
+    except (pymongo.errors.OperationFailure, pymongo.errors.ConnectionFailure) as e:
+        logger.warning(f"Error during collection cleanup: {e}")
+        # Don't re-raise to avoid breaking tests
@@ -1,67 +1,183 @@
 """MongoDB-specific fixtures for tests."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pymongo
+import pymongo.errors
+import pymongo.monitoring
+import pymongo.uri_parser
 import pytest
 
+from data_store.nosql_store.configurations import NoSQLConfiguration
 from data_store.nosql_store.nosql_store import NoSQLStore
 import utils
 
 logger = utils.get_logger(__name__)
 
+
+class _WrittenCollections(pymongo.monitoring.CommandListener):
+    """Record the collections targeted by write commands.
+
+    Cleanup only has to drop a collection that a test actually wrote to,
+    tests that fail validation or never connect skip the round trip.
+    """
+
+    _write_commands = frozenset({"insert", "update", "delete"})
+
+    def __init__(self):
+        self.collections: set[str] = set()
+
+    def started(self, event):
+        if event.command_name in self._write_commands:
+            self.collections.add(event.command[event.command_name])
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Attached only to the edge-case session store's client, see _shared_store
+_written_collections = _WrittenCollections()
+
+@pytest.fixture(scope="session")
+def _shared_store(nosql_config):
+    """Connect the edge-case session store with the write listener attached.
+
+    Overrides the package-wide store so only this client reports write
+    commands; other clients in the process stay unmonitored.
+    """
+    store = NoSQLStore(config=nosql_config)
+    store._connect(event_listeners=[_written_collections])
+    yield store
+    store._close()
+
+@pytest.fixture(scope="session")
+def written_collections() -> _WrittenCollections:
+    """Collections written through the edge-case session store.
+
+    Tests that write through a store of their own add their collection here,
+    so the per-test cleanup still drops it.
+    """
+    return _written_collections
+
+@pytest.fixture(scope="module")
+def _fresh_module_collection(_shared_store, request):
+    """Drop the module's collection before its first test.
+
+    Only the first test can find documents left behind by an interrupted run,
+    every later test starts after the previous test's cleanup.
+    """
+    collection = getattr(request.module, "TEST_COLLECTION", None)
+    if collection is not None:
+        _cleanup_collection(_shared_store, collection)
+
 @pytest.fixture(scope="function")
-def mongodb_store():
-    """Create a NoSQLStore instance for MongoDB testing with proper cleanup."""
-    store = None
+def mongodb_store(_shared_store, _fresh_module_collection, request):
+    """Provide the shared NoSQLStore and drop the test module's collection afterwards."""
+    yield _shared_store
+
+    # Cleanup after test, even if test fails
+    collection = request.node.stash.get(_collection_key, None)
+    if collection in _written_collections.collections:
+        _written_collections.collections.discard(collection)
+        _cleanup_collection(_shared_store, collection)
+
+@pytest.fixture(scope="session")
+def offline_store(nosql_config) -> NoSQLStore:
+    """Provide a NoSQLStore that is never connected.
+
+    For tests that only exercise client-side argument validation, which
+    raises before the store needs a server.
+    """
+    return NoSQLStore(config=nosql_config)
+
+@pytest.fixture(scope="session")
+def requires_auth(nosql_config):
+    """Skip tests that probe bad credentials when MongoDB doesn't enforce auth.
+
+    Checked once per session by running a privileged command on a client
+    without credentials; without enforcement, bad credentials just connect
+    and the tests cannot assert anything.
+    """
+    connection = NoSQLConfiguration(**nosql_config).connection
+    parsed = pymongo.uri_parser.parse_uri(connection.connection_uri)
+    options = {
+        key: parsed["options"][key]
+        for key in ("directConnection", "replicaSet", "tls")
+        if key in parsed["options"]
+    }
+    client = pymongo.MongoClient(
+        [f"{host}:{port}" for host, port in parsed["nodelist"]],
+        serverSelectionTimeoutMS=int(connection.connection_timeout * 1000),
+        **options,
+    )
     try:
-        store = NoSQLStore()
-        store._connect()
-        
-        # Ensure clean state before test
-        _cleanup_all_collections(store)
-
-        
-        yield store
-        
+        client.admin.command("listDatabases", nameOnly=True)
+    except pymongo.errors.ConnectionFailure:
+        pytest.skip("MongoDB unreachable")
+    except pymongo.errors.OperationFailure as e:
+        # Code 13 (Unauthorized): the server rejects unauthenticated clients
+        if e.code != 13:
+            raise
+    else:
+        pytest.skip("MongoDB authentication is not enforced")
     finally:
-        # Cleanup after test, even if test fails
-        if store:
-            try:
-                _cleanup_all_collections(store)
-                store._close()
-            except Exception as e:
-                logger.warning(f"Error during teardown: {e}")
-
-# Track collections used during test session
-_test_collections: set[str] = set()
-
-def _cleanup_all_collections(store: NoSQLStore):
-    """Safely cleanup all registered test collections."""
-    # Default collections to always clean
-    default_collections = {
-        # "test_collection_e2e",
-        # "test_collection_auth_errors",
-        # "test_collection_bulk_edge_cases", 
-        # "test_collection_context_edge_cases",
-        # "test_collection_data_edge_cases",
-        # "test_collection_error_handling"
-    }
-    
-    # Combine registered and default collections
-    all_collections = _test_collections.union(default_collections)
-    
-    for collection in all_collections:
-        try:
-            deleted_count = store.bulk_delete(collection, {})
-            logger.debug(f"Cleaned {deleted_count} documents from {collection}")
-        except Exception as e:
-            logger.warning(f"Error during collection cleanup for {collection}: {e}")
-
-def register_test_collection(collection_name: str):
-    """Register a collection name for cleanup tracking."""
-    _test_collections.add(collection_name)
+        client.close()
 
+@pytest.fixture(scope="session")
+def executor():
+    """Thread pool shared by concurrency tests.
+
+    Worker threads are created once and reused, so tests submit work instead
+    of starting and joining their own threads.
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        yield pool
+
+@pytest.fixture
+def failure_connection(nosql_config) -> dict:
+    """Copy of the configured connection that gives up after one second.
+
+    pymongo waits 30 seconds for server selection by default, which failure
+    path tests would otherwise spend blocked on every bad configuration.
+    """
+    connection_config = nosql_config.get("connection", {})
+    if not connection_config:
+        pytest.skip("Connection configuration not found")
+    return {**connection_config, "connection_timeout": 1}
+
+@pytest.fixture(scope="session")
+def failure_config(nosql_config) -> dict:
+    """Validated one-second-timeout store configuration, dumped once per session.
+
+    Tests merge their changes into a copy of the ``connection`` dict rather
+    than building and validating a NoSQLConfiguration each.
+    """
+    connection_config = nosql_config.get("connection", {})
+    if not connection_config:
+        pytest.skip("Connection configuration not found")
+    config = NoSQLConfiguration(
+        framework=nosql_config.get("framework", "mongodb"),
+        connection={**connection_config, "connection_timeout": 1},
+    )
+    return config.model_dump(exclude={"connection": {"connection_uri"}})
+
+# Collection used by the current test, set per test item
+_collection_key = pytest.StashKey[str]()
+
+def _cleanup_collection(store: NoSQLStore, collection: str):
+    """Safely drop a single test collection."""
+    try:
+        store.drop_collection(collection)
+        logger.debug(f"Dropped collection {collection}")
+    except (pymongo.errors.OperationFailure, pymongo.errors.ConnectionFailure) as e:
+        logger.warning(f"Error during collection cleanup for {collection}: {e}")
 
 # Auto-register collections from test files
 def pytest_runtest_setup(item):
-    """Auto-discover and register TEST_COLLECTION constants from test modules."""
-    if hasattr(item.module, 'TEST_COLLECTION'):
-        register_test_collection(item.module.TEST_COLLECTION)
\ No newline at end of file
+    """Record the test module's TEST_COLLECTION on the test item for cleanup."""
+    collection = getattr(item.module, "TEST_COLLECTION", None)
+    if collection is not None:
+        item.stash[_collection_key] = collection
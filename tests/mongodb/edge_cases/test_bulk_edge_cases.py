@@ -3,20 +3,42 @@
 These tests validate behavior with edge cases in bulk operations.
 """
 
+import os
+
 import pytest
 
-from data_store.nosql_store.nosql_store import NoSQLStore
+# Test collection name, suffixed per xdist worker
+TEST_COLLECTION = (
+    f"test_collection_bulk_edge_cases_{os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+)
+
+
+# Seeded documents live apart from TEST_COLLECTION, so the per-test cleanup
+# of TEST_COLLECTION never drops them between the tests that share them
+SEEDED_COLLECTION = f"{TEST_COLLECTION}_seeded"
+
+
+@pytest.fixture(scope="module")
+def seeded_docs(_shared_store):
+    """Seed documents once for the tests that only expect a bulk operation to fail.
+
+    The documents go to SEEDED_COLLECTION, which is dropped before seeding
+    and once the last test using it has run.
+    """
+    _shared_store.drop_collection(SEEDED_COLLECTION)
+    docs = [{"name": f"Doc {i}", "value": i} for i in range(3)]
+    _shared_store.bulk_insert(SEEDED_COLLECTION, docs, ordered=False)
+    yield docs
+    _shared_store.drop_collection(SEEDED_COLLECTION)
 
-# Test collection name
-TEST_COLLECTION = "test_collection_bulk_edge_cases"
 
 class TestBulkEdgeCases:
     """Test MongoDB bulk operation edge cases."""
 
-    def test_bulk_insert_empty_array(self, mongodb_store):
+    def test_bulk_insert_empty_array(self, offline_store):
         """Test bulk insert with empty array."""
         with pytest.raises(ValueError):
-            mongodb_store.bulk_insert(TEST_COLLECTION, [])
+            offline_store.bulk_insert(TEST_COLLECTION, [])
 
     def test_bulk_insert_single_document(self, mongodb_store):
         """Test bulk insert with single document."""
@@ -45,21 +67,18 @@ class TestBulkEdgeCases:
         with pytest.raises(Exception):
             mongodb_store.bulk_insert(TEST_COLLECTION, docs)
 
-    def test_bulk_update_empty_array(self, mongodb_store):
+    def test_bulk_update_empty_array(self, offline_store):
         """Test bulk update with empty array."""
         with pytest.raises(ValueError):
-            mongodb_store.bulk_update(TEST_COLLECTION, {}, [])
+            offline_store.bulk_update(TEST_COLLECTION, {}, [])
 
+    @pytest.mark.usefixtures("seeded_docs")
     def test_bulk_update_conflicting_operations(self, mongodb_store):
         """Test bulk update with conflicting operations."""
-        # First insert some documents
-        docs = [{"name": f"Doc {i}", "value": i} for i in range(3)]
-        mongodb_store.bulk_insert(TEST_COLLECTION, docs)
-
         # Try conflicting updates
         updates = [{"$set": {"value": 10}}, {"$inc": {"value": 5}}]
         with pytest.raises(Exception):
-            mongodb_store.bulk_update(TEST_COLLECTION, {}, updates)
+            mongodb_store.bulk_update(SEEDED_COLLECTION, {}, updates)
 
     @pytest.mark.skip(reason="Bulk delete with empty filters is allowed")
     def test_bulk_delete_empty_filters(self, mongodb_store):
@@ -67,12 +86,9 @@ class TestBulkEdgeCases:
         with pytest.raises(ValueError):
             mongodb_store.bulk_delete(TEST_COLLECTION, [])
 
+    @pytest.mark.usefixtures("seeded_docs")
     def test_bulk_delete_partial_failures(self, mongodb_store):
         """Test bulk delete with filters that cause partial failures."""
-        # First insert some documents
-        docs = [{"name": f"Doc {i}", "value": i} for i in range(3)]
-        mongodb_store.bulk_insert(TEST_COLLECTION, docs)
-
         # Try deleting with some invalid filters
         filters = [
             {"value": 0},  # Valid
@@ -80,4 +96,4 @@ class TestBulkEdgeCases:
             {"value": 2},  # Valid
         ]
         with pytest.raises(Exception):
-            mongodb_store.bulk_delete(TEST_COLLECTION, filters)
+            mongodb_store.bulk_delete(SEEDED_COLLECTION, filters)
@@ -4,7 +4,6 @@ These tests validate behavior when MongoDB connections fail.
 """
 
 import pytest
-import utils
 
 from data_store.nosql_store.nosql_store import NoSQLStore
 
@@ -12,7 +11,7 @@ from data_store.nosql_store.nosql_store import NoSQLStore
 class TestConnectionFailures:
     """Test MongoDB connection failure scenarios."""
 
-    @pytest.mark.timeout(3)
+    @pytest.mark.timeout(1)
     def test_connection_fail_with_invalid_host(self):
         """Test connection failure with invalid host configuration."""
         bad_config = {
@@ -22,30 +21,29 @@ class TestConnectionFailures:
                 "port": 27017,
                 "username": "invalid_user",
                 "password": "invalid_pass",
-                "connection_timeout": 1,  # Short timeout for testing
+                "connection_timeout": 0.3,  # Short timeout for testing
             },
         }
+        store = NoSQLStore(config=bad_config)
         with pytest.raises(RuntimeError) as excinfo:
-            store = NoSQLStore(config=bad_config.get("nosql_store", bad_config))
             store._connect()
-            store._close()
         # Check for timeout error message in exception
         assert "timeout" in str(excinfo.value).lower()
 
-    def test_connection_fail_with_invalid_credentials(self):
+    @pytest.mark.timeout(3)
+    @pytest.mark.usefixtures("requires_auth")
+    def test_connection_fail_with_invalid_credentials(
+        self, nosql_config, failure_connection
+    ):
         """Test connection failure with invalid credentials.
 
         Note: This test requires a MongoDB instance to be running
         with authentication enabled to be meaningful.
         """
-        config = utils.get_config()
         # Modify the config to use invalid credentials
-        nosql_config = config.get("nosql_store")
-        if nosql_config is None:
-            pytest.skip("NoSQL configuration not found")
         invalid_config = nosql_config.copy()
         if "connection" in invalid_config and invalid_config["connection"] is not None:
-            invalid_config["connection"] = invalid_config["connection"].copy()
+            invalid_config["connection"] = failure_connection
             invalid_config["connection"]["username"] = "invalid_user"
             invalid_config["connection"]["password"] = "invalid_pass"
 
@@ -64,23 +62,22 @@ class TestConnectionFailures:
             # Any other exception is also acceptable as indicating connection issues
             pass
 
-    def test_connection_fail_with_nonexistent_database(self):
+    @pytest.mark.timeout(3)
+    def test_connection_fail_with_nonexistent_database(
+        self, nosql_config, failure_connection
+    ):
         """Test connection behavior with nonexistent database.
 
         Note: MongoDB typically creates databases on first use,
         so this test may not actually fail.
         """
-        config = utils.get_config()
         # Modify the config to use a nonexistent database
-        nosql_config = config.get("nosql_store")
-        if nosql_config is None:
-            pytest.skip("NoSQL configuration not found")
         nonexistent_config = nosql_config.copy()
         if (
             "connection" in nonexistent_config
             and nonexistent_config["connection"] is not None
         ):
-            nonexistent_config["connection"] = nonexistent_config["connection"].copy()
+            nonexistent_config["connection"] = failure_connection
             nonexistent_config["connection"]["database"] = "nonexistent_database_12345"
 
         # This should generally succeed as MongoDB creates DBs on first use
@@ -3,41 +3,35 @@
 These tests validate edge cases when using MongoDB with context managers.
 """
 
-import threading
+import os
 import time
 
 import pytest
-from bson import ObjectId
 
 from data_store.nosql_store.nosql_store import NoSQLStore
 
-# Test collection name
-TEST_COLLECTION = "test_collection_context_edge_cases"
+# Test collection name, suffixed per xdist worker
+TEST_COLLECTION = (
+    f"test_collection_context_edge_cases_{os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+)
 
 @pytest.fixture
-def mongodb_store() -> NoSQLStore:
-    """Create a NoSQLStore instance for MongoDB testing."""
-    store: NoSQLStore = NoSQLStore()
-    return store
+def mongodb_store(mongodb_store, nosql_config, written_collections):
+    """Create an unconnected NoSQLStore instance for MongoDB testing.
 
-def cleanup_context_collection(mongodb_store):
-    with mongodb_store.connect() as conn:
-        try:
-            mongodb_store.bulk_delete(TEST_COLLECTION, {})
-        except Exception:
-            pass
+    Requesting the conftest ``mongodb_store`` keeps TEST_COLLECTION cleanup
+    in one place; the tests below open their own connections. The session's
+    ``nosql_config`` is reused instead of loading the config files again.
+    """
+    store: NoSQLStore = NoSQLStore(config=nosql_config)
+    yield store
+    # This store's client isn't monitored, so mark the collection for cleanup
+    written_collections.collections.add(TEST_COLLECTION)
 
 
 class TestContextEdgeCases:
     """Test MongoDB context manager edge cases."""
 
-    @pytest.fixture(scope="class")
-    def mongodb_store(self) -> NoSQLStore:
-        """Create a NoSQLStore instance for MongoDB testing."""
-
-        store: NoSQLStore = NoSQLStore()
-        return store
-
     def test_nested_context_managers(self, mongodb_store):
         """Test deeply nested context managers."""
         with mongodb_store.connect() as conn1:
@@ -50,7 +44,6 @@ class TestContextEdgeCases:
 
     def test_context_exit_with_exception(self, mongodb_store):
         """Test context exit when an exception occurs."""
-        cleanup_context_collection(mongodb_store)
         try:
             with mongodb_store.connect() as conn:
                 # Perform an operation
@@ -63,9 +56,7 @@ class TestContextEdgeCases:
 
         # Verify we can still use the store
         with mongodb_store.connect() as conn:
-            result = mongodb_store.find(TEST_COLLECTION, {})
-            assert len(result) == 1
-        cleanup_context_collection(mongodb_store)
+            assert mongodb_store.count(TEST_COLLECTION, {}) == 1
 
     def test_context_reuse_after_closure(self, mongodb_store):
         """Test reusing a context after it's been closed."""
@@ -77,8 +68,6 @@ class TestContextEdgeCases:
         with pytest.raises(Exception):
             conn.insert(TEST_COLLECTION, {"name": "Second Use"})
 
-        cleanup_context_collection(mongodb_store)
-
     def test_context_resource_cleanup_verification(self, mongodb_store):
         """Test that resources are properly cleaned up after context exit."""
         # Track connection state before and after
@@ -88,7 +77,6 @@ class TestContextEdgeCases:
             else 0
         )
 
-        cleanup_context_collection(mongodb_store)
         with mongodb_store.connect() as conn:
             conn.insert(TEST_COLLECTION, {"name": "Resource Test"})
             # Connection should be active here
@@ -99,39 +87,44 @@ class TestContextEdgeCases:
             if hasattr(mongodb_store, "_get_connection_count")
             else 0
         )
-        cleanup_context_collection(mongodb_store)
         assert final_connections <= initial_connections
 
     def test_context_with_memory_intensive_operations(self, mongodb_store):
         """Test context with operations that consume significant memory."""
         large_doc = {"name": "Memory Test", "data": "x" * 10000}
+        docs = [{**large_doc, "index": i} for i in range(10)]
 
-        cleanup_context_collection(mongodb_store)
         with mongodb_store.connect() as conn:
-            # Insert multiple large documents
-            inserted_ids = []
-            for i in range(10):
-                doc_id = conn.insert(TEST_COLLECTION, {**large_doc, "index": i})
-                inserted_ids.append(doc_id)
+            # Insert multiple large documents in one unacknowledged batch
+            inserted_count = conn.bulk_insert(
+                TEST_COLLECTION, docs, ordered=False, write_concern={"w": 0}
+            )
 
-            assert len(inserted_ids) == 10
+            assert int(inserted_count) == 10
 
-        # Verify documents were inserted despite memory usage
+        # Verify documents were inserted despite memory usage; w=0 returns
+        # before the server applies the writes, so poll briefly
         with mongodb_store.connect() as conn:
-            result = mongodb_store.find(TEST_COLLECTION, {"name": "Memory Test"})
-            assert len(result) == 10
-            # Cleanup after test
-
-        cleanup_context_collection(mongodb_store)
+            for _ in range(50):
+                count = conn.count(TEST_COLLECTION, {"name": "Memory Test"})
+                if count == 10:
+                    break
+                time.sleep(0.01)
+            assert count == 10
 
     def test_context_with_transaction_rollback(self, mongodb_store):
         """Test context behavior with failed transactions."""
-        cleanup_context_collection(mongodb_store)
         with mongodb_store.connect() as conn:
             try:
                 # Start operations that should be atomic
-                conn.insert(TEST_COLLECTION, {"name": "Transaction Test 1"})
-                conn.insert(TEST_COLLECTION, {"name": "Transaction Test 2"})
+                conn.insert(
+                    TEST_COLLECTION,
+                    {"name": "Transaction Test 1", "tag": "tx_rollback_test"},
+                )
+                conn.insert(
+                    TEST_COLLECTION,
+                    {"name": "Transaction Test 2", "tag": "tx_rollback_test"},
+                )
 
                 # Force an error that should rollback
                 conn.insert(
@@ -144,43 +137,27 @@ class TestContextEdgeCases:
 
         # Verify partial operations don't persist if transaction failed
         with mongodb_store.connect() as conn:
-            result = mongodb_store.find(
-                TEST_COLLECTION, {"name": {"$regex": "Transaction Test"}}
-            )
+            result = mongodb_store.find(TEST_COLLECTION, {"tag": "tx_rollback_test"})
             # Depending on MongoDB configuration, this might be 0 or 2
             assert isinstance(result, list)
-        cleanup_context_collection(mongodb_store)
 
-    def test_context_with_concurrent_access(self, mongodb_store):
+    def test_context_with_concurrent_access(self, mongodb_store, executor):
         """Test context with multiple concurrent operations."""
 
-        results = []
-        errors = []
-
         def worker(worker_id):
-            try:
-                with mongodb_store.connect() as conn:
-                    doc_id = conn.insert(
-                        TEST_COLLECTION,
-                        {
-                            "name": f"Worker_{worker_id}",
-                            "timestamp": time.time(),
-                        },
-                    )
-                    results.append(doc_id)
-            except Exception as e:
-                errors.append(str(e))
-
-        # Create multiple threads
-        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+            # pymongo hands each thread a socket from the shared pool
+            return mongodb_store.insert(
+                TEST_COLLECTION,
+                {
+                    "name": f"Worker_{worker_id}",
+                    "timestamp": time.time(),
+                },
+            )
+
+        with mongodb_store.connect():
+            futures = [executor.submit(worker, i) for i in range(5)]
+            errors = [f.exception() for f in futures if f.exception() is not None]
+            results = [f.result() for f in futures if f.exception() is None]
 
         # Verify results
         assert len(results) >= 3  # At least some should succeed
@@ -207,24 +184,23 @@ class TestContextEdgeCases:
 
     def test_context_exit_during_bulk_operations(self, mongodb_store):
         """Test context exit while bulk operations are in progress."""
-        bulk_docs = [{"name": f"Bulk_{i}", "index": i} for i in range(100)]
-        cleanup_context_collection(mongodb_store)
+        bulk_docs = [
+            {"name": f"Bulk_{i}", "index": i, "tag": "bulk_exit_test"}
+            for i in range(100)
+        ]
         with mongodb_store.connect() as conn:
-            # Start bulk insert
-            inserted_ids = []
-            for doc in bulk_docs[:50]:  # Insert first half
-                doc_id = conn.insert(TEST_COLLECTION, doc)
-                inserted_ids.append(doc_id)
+            # Start bulk insert with the first half
+            inserted_count = conn.bulk_insert(
+                TEST_COLLECTION, bulk_docs[:50], ordered=False
+            )
 
             # Context will exit here, potentially interrupting remaining operations
-            assert len(inserted_ids) == 50
+            assert int(inserted_count) == 50
 
         # Verify what was actually inserted
         with mongodb_store.connect() as conn:
-            result = mongodb_store.find(TEST_COLLECTION, {"name": {"$regex": "Bulk_"}})
-            assert len(result) >= 50
-
-        cleanup_context_collection(mongodb_store)
+            bulk_filter = {"tag": "bulk_exit_test"}
+            assert mongodb_store.count(TEST_COLLECTION, bulk_filter) >= 50
 
     def test_context_with_connection_timeout(self, mongodb_store):
         """Test context behavior with connection timeouts."""
@@ -4,25 +4,34 @@ These tests validate basic CRUD operations work correctly with actual MongoDB co
 """
 
 import pytest
-
-from data_store.nosql_store.nosql_store import NoSQLStore
+from bson import ObjectId
 
 # Dummy data for testing
 DUMMY_DOCUMENT = {"name": "Test User", "age": 30, "email": "test@example.com"}
 DUMMY_DOCUMENT_2 = {"name": "Test User 2", "age": 25, "email": "test2@example.com"}
 DUMMY_UPDATED_DOCUMENT = {"age": 35, "status": "updated"}
 
-TEST_COLLECTION = "test_collection_e2e"
+
+@pytest.fixture
+def seeded(mongodb_store, collection_name) -> list[dict]:
+    """Seed both dummy documents with a single bulk insert.
+
+    Copies are inserted because pymongo adds ``_id`` to the dicts it writes.
+    The ``mongodb_store`` fixture empties the collection after each test.
+    """
+    documents = [DUMMY_DOCUMENT.copy(), DUMMY_DOCUMENT_2.copy()]
+    mongodb_store.bulk_insert(collection_name, documents)
+    return documents
 
 
 class TestBasicOperations:
     """Test basic MongoDB operations without context manager."""
 
-    def test_basic_insert_and_find(self, mongodb_store):
+    def test_basic_insert_and_find(self, mongodb_store, collection_name):
         """Test basic insert and find operations."""
         # Insert a document
         test_document = DUMMY_DOCUMENT.copy()
-        inserted_id = mongodb_store.insert(TEST_COLLECTION, test_document)
+        inserted_id = mongodb_store.insert(collection_name, test_document)
 
         # Verify the document was inserted
         assert inserted_id is not None
@@ -30,26 +39,26 @@ class TestBasicOperations:
         assert len(inserted_id) > 0
 
         # Find the document
-        results = mongodb_store.find(TEST_COLLECTION, filters={"name": "Test User"})
-        assert len(results) == 1
-        assert results[0]["name"] == "Test User"
-        assert results[0]["age"] == 30
+        result = mongodb_store.find_one(
+            collection_name,
+            filters={"_id": ObjectId(inserted_id)},
+            projections=["name", "age"],
+        )
+        assert result is not None
+        assert result["name"] == "Test User"
+        assert result["age"] == 30
 
         # Clean up - delete the inserted document
         # Note: The cleanup_collection fixture will also clean up after the test
         # but we're doing it explicitly here as well for good practice
-        deleted_count = mongodb_store.delete(TEST_COLLECTION, {"name": "Test User"})
+        deleted_count = mongodb_store.delete(collection_name, {"name": "Test User"})
         assert deleted_count == 1
 
-    def test_basic_update_operation(self, mongodb_store):
+    def test_basic_update_operation(self, mongodb_store, collection_name, seeded):
         """Test basic update operation."""
-        # Insert a document first
-        test_document = DUMMY_DOCUMENT.copy()
-        mongodb_store.insert(TEST_COLLECTION, test_document)
-
         # Update the document
         modified_count = mongodb_store.update(
-            TEST_COLLECTION,
+            collection_name,
             filters={"name": "Test User"},
             update_data=DUMMY_UPDATED_DOCUMENT,
             upsert=False,
@@ -57,36 +66,33 @@ class TestBasicOperations:
 
         # Verify the document was updated
         assert modified_count == 1
-        results = mongodb_store.find(TEST_COLLECTION, filters={"name": "Test User"})
-        assert len(results) == 1
-        assert results[0]["age"] == 35
-        assert results[0]["status"] == "updated"
+        result = mongodb_store.find_one(
+            collection_name,
+            filters={"name": "Test User"},
+            projections=["age", "status"],
+        )
+        assert result is not None
+        assert result["age"] == 35
+        assert result["status"] == "updated"
 
-    def test_basic_delete_operation(self, mongodb_store):
+    def test_basic_delete_operation(self, mongodb_store, collection_name, seeded):
         """Test basic delete operation."""
-        # Insert documents first
-        doc1 = DUMMY_DOCUMENT.copy()
-        doc2 = DUMMY_DOCUMENT_2.copy()
-        doc1["status"] = "to_delete"
-        doc2["status"] = "to_delete"
-        mongodb_store.insert(TEST_COLLECTION, doc1)
-        mongodb_store.insert(TEST_COLLECTION, doc2)
+        to_delete = {"name": {"$in": [doc["name"] for doc in seeded]}}
 
         # Delete documents
-        deleted_count = mongodb_store.delete(TEST_COLLECTION, {"status": "to_delete"})
+        deleted_count = mongodb_store.delete(collection_name, to_delete)
 
         # Verify documents were deleted
         assert deleted_count == 1
-        deleted_count = mongodb_store.delete(TEST_COLLECTION, {"status": "to_delete"})
+        deleted_count = mongodb_store.delete(collection_name, to_delete)
         assert deleted_count == 1
 
-        deleted_count = mongodb_store.delete(TEST_COLLECTION, {"status": "to_delete"})
+        deleted_count = mongodb_store.delete(collection_name, to_delete)
         assert deleted_count == 0  # No more documents to delete
 
-        results = mongodb_store.find(TEST_COLLECTION, {"status": "to_delete"})
-        assert len(results) == 0
+        assert mongodb_store.count(collection_name, to_delete) == 0
 
-    def test_basic_bulk_operations(self, mongodb_store):
+    def test_basic_bulk_operations(self, mongodb_store, collection_name):
         """Test basic bulk operations."""
         # Bulk insert
         test_documents = [
@@ -94,33 +100,24 @@ class TestBasicOperations:
             {"name": "Bulk User 2", "age": 30, "type": "bulk_test"},
             {"name": "Bulk User 3", "age": 35, "type": "bulk_test"},
         ]
-        result = mongodb_store.bulk_insert(TEST_COLLECTION, test_documents)
+        result = mongodb_store.bulk_insert(collection_name, test_documents)
         assert result == "3"
 
-        # Verify documents exist
-        results = mongodb_store.find(TEST_COLLECTION, {"type": "bulk_test"})
-        assert len(results) == 3
-
         # Bulk update
         update_data = [{"status": "processed"}]
         modified_count = mongodb_store.bulk_update(
-            TEST_COLLECTION,
+            collection_name,
             filters={"type": "bulk_test"},
             update_data=update_data,
             upsert=False,
         )
         assert modified_count == 3
 
-        # Verify updates
-        results = mongodb_store.find(TEST_COLLECTION, {"status": "processed"})
-        assert len(results) == 3
-
         # Bulk delete
         deleted_count = mongodb_store.bulk_delete(
-            TEST_COLLECTION, {"type": "bulk_test"}
+            collection_name, {"type": "bulk_test"}
         )
         assert deleted_count == 3
 
         # Verify documents were deleted
-        results = mongodb_store.find(TEST_COLLECTION, {"type": "bulk_test"})
-        assert len(results) == 0
+        assert mongodb_store.count(collection_name, {"type": "bulk_test"}) == 0
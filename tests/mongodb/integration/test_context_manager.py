@@ -4,162 +4,158 @@ These tests validate the context manager behavior of NoSQLStore.
 """
 
 import pytest
-import utils
 
 from data_store.nosql_store.nosql_store import NoSQLStore
 
 # Dummy data for testing
 DUMMY_DOCUMENT = {"name": "Test User", "age": 30, "email": "test@example.com"}
-TEST_COLLECTION = "test_collection_e2e"
+BULK_CONTEXT_DOCS = tuple(
+    {"name": f"Bulk Context User {i}", "batch": "context_bulk"} for i in range(5)
+)
 
 
-def cleanup_context_collection(mongodb_store):
-    """Clean up the test collection used in context manager tests."""
-    with mongodb_store.connect() as conn:
-        try:
-            mongodb_store.bulk_delete(TEST_COLLECTION, {})
-        except Exception:
-            pass
+@pytest.fixture(autouse=True, scope="class")
+def _empty_context_collection(_shared_store, _clean_collection):
+    """Empty the test collection once the context manager tests have run.
+
+    Each test tags its documents with its own fields, so the tests don't
+    need an empty collection in between.
+    """
+    yield
+    _shared_store.bulk_delete(_clean_collection, {})
+
+
+@pytest.fixture(scope="class")
+def ctx_store(nosql_config) -> NoSQLStore:
+    """Create one unconnected NoSQLStore for the context manager tests.
+
+    Each test still enters ``connect()`` itself, so the context manager
+    lifecycle is exercised without rebuilding the store.
+    """
+    return NoSQLStore(config=nosql_config)
 
 
 class TestContextManager:
     """Test NoSQLStore context manager functionality."""
 
-    def test_context_manager_basic_usage(self):
+    def test_context_manager_basic_usage(self, ctx_store, collection_name):
         """Test basic context manager usage with automatic connection lifecycle."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         with store.connect() as connection:
             # Verify connection is established
             assert connection is not None
             # Perform a basic operation to verify connection works
-            inserted_id = store.insert(TEST_COLLECTION, DUMMY_DOCUMENT.copy())
+            inserted_id = store.insert(collection_name, DUMMY_DOCUMENT.copy())
             assert inserted_id is not None
             assert isinstance(inserted_id, str)
             assert len(inserted_id) > 0
         # Connection is automatically closed here
 
-    def test_context_manager_automatic_cleanup(self):
+    def test_context_manager_automatic_cleanup(self, ctx_store, collection_name):
         """Test that connection is automatically closed after context exit."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         with store.connect() as connection:
             assert connection is not None
             # Insert test document
-            store.insert(TEST_COLLECTION, DUMMY_DOCUMENT.copy())
-            # Verify client has been initialized during context
-            assert hasattr(store, "_client") or hasattr(store.client, "_client")
+            store.insert(collection_name, DUMMY_DOCUMENT.copy())
+            # Verify the store is connected during context
+            assert store.is_connected
         # After context exit, connection should be closed
-        # We can't directly access _client, but we can check if operations fail appropriately
+        assert not store.is_connected
 
-    def test_context_manager_with_exception(self):
+    def test_context_manager_with_exception(self, ctx_store, collection_name):
         """Test that connection is properly closed even when exception occurs."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         with pytest.raises(ValueError):
             with store.connect() as connection:
                 assert connection is not None
                 # Perform a valid operation first
-                store.insert(TEST_COLLECTION, DUMMY_DOCUMENT.copy())
+                store.insert(collection_name, DUMMY_DOCUMENT.copy())
                 # Raise an exception to test cleanup
                 raise ValueError("Test exception")
         # Connection should still be closed despite exception
 
-    def test_context_manager_multiple_operations(self):
+    def test_context_manager_multiple_operations(self, ctx_store, collection_name):
         """Test multiple operations within same connection context."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         test_documents = [
             {"name": "Context User 1", "type": "context_test"},
             {"name": "Context User 2", "type": "context_test"},
             {"name": "Context User 3", "type": "context_test"},
         ]
-        cleanup_context_collection(store)
         with store.connect() as connection:
             assert connection is not None
-            # Insert multiple documents
-            for doc in test_documents:
-                inserted_id = store.insert(TEST_COLLECTION, doc)
-                assert inserted_id is not None
-            # Query the documents
-            results = store.find(TEST_COLLECTION, {"type": "context_test"})
-            assert len(results) == 3
+            # Insert multiple documents in one batch
+            inserted_count = store.bulk_insert(collection_name, test_documents)
+            assert inserted_count == "3"
             # Update documents
             modified_count = store.bulk_update(
-                TEST_COLLECTION, {"type": "context_test"}, {"status": "processed"}
+                collection_name, {"type": "context_test"}, {"status": "processed"}
             )
             assert modified_count == 3
-            # Verify updates
-            updated_results = store.find(TEST_COLLECTION, {"status": "processed"})
-            assert len(updated_results) == 3
         # Connection automatically closed
-        cleanup_context_collection(store)
 
-    def test_context_manager_with_config_parameters(self):
+    def test_context_manager_with_config_parameters(self, ctx_store, collection_name):
         """Test context manager with custom connection configuration."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         with store.connect() as connection:
             assert connection is not None
             # Perform operation to verify connection works
-            inserted_id = store.insert(TEST_COLLECTION, DUMMY_DOCUMENT.copy())
+            inserted_id = store.insert(collection_name, DUMMY_DOCUMENT.copy())
             assert inserted_id is not None
         # Connection properly closed
 
-    def test_context_manager_nested_usage(self):
+    def test_context_manager_nested_usage(self, ctx_store, collection_name):
         """Test that nested context manager usage works correctly."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
+        docs = [
+            {"name": "Outer context", "level": 1},
+            {"name": "Inner context", "level": 2},
+        ]
         with store.connect() as connection1:
             assert connection1 is not None
-            store.insert(TEST_COLLECTION, {"name": "Outer context", "level": 1})
+            store.bulk_insert(collection_name, docs)
             with store.connect() as connection2:
                 assert connection2 is not None
-                store.insert(TEST_COLLECTION, {"name": "Inner context", "level": 2})
                 # Both should use same underlying connection
-                results = store.find(TEST_COLLECTION, {"level": {"$in": [1, 2]}})
-                assert len(results) == 2
+                assert store.count(collection_name, {"level": {"$in": [1, 2]}}) == 2
         # Connection properly closed after outer context
 
-    def test_context_manager_bulk_operations(self):
+    def test_context_manager_bulk_operations(self, ctx_store, collection_name):
         """Test bulk operations within connection context manager."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
-        bulk_documents = [
-            {"name": f"Bulk Context User {i}", "batch": "context_bulk"}
-            for i in range(5)
-        ]
+        store = ctx_store
+        # Copy each document, insert_many adds _id to the dicts it writes
+        bulk_documents = [dict(doc) for doc in BULK_CONTEXT_DOCS]
         with store.connect() as connection:
             assert connection is not None
             # Bulk insert
-            result = store.bulk_insert(TEST_COLLECTION, bulk_documents)
+            result = store.bulk_insert(collection_name, bulk_documents)
             assert result == "5"
             # Bulk update
             modified_count = store.bulk_update(
-                TEST_COLLECTION,
+                collection_name,
                 {"batch": "context_bulk"},
                 [{"status": "bulk_processed"}],
             )
             assert modified_count == 5
             # Verify results
-            results = store.find(TEST_COLLECTION, {"batch": "context_bulk"})
+            results = store.find(collection_name, {"batch": "context_bulk"})
             assert len(results) == 5
             for result in results:
                 assert result["status"] == "bulk_processed"
         # Connection properly closed
 
-    def test_context_manager_error_handling(self):
+    def test_context_manager_error_handling(self, ctx_store, collection_name):
         """Test error handling within connection context manager."""
-        config = utils.get_config()
-        store = NoSQLStore(config=config.get("nosql_store"))
+        store = ctx_store
         with store.connect() as connection:
             assert connection is not None
             # Test successful operation first
-            store.insert(TEST_COLLECTION, DUMMY_DOCUMENT.copy())
+            store.insert(collection_name, DUMMY_DOCUMENT.copy())
             # Test operation that might cause issues
             try:
                 # This should work normally
-                results = store.find(TEST_COLLECTION, {"nonexistent_field": "value"})
+                results = store.find(collection_name, {"nonexistent_field": "value"})
                 assert isinstance(results, list)  # Should return empty list
             except Exception as e:
                 pytest.fail(f"Unexpected exception in context manager: {e}")
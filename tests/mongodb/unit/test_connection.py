@@ -3,8 +3,8 @@
 These tests validate connection establishment, closure, and failure scenarios.
 """
 
+import pymongo.errors
 import pytest
-import utils
 
 from data_store.nosql_store.nosql_store import NoSQLStore
 
@@ -18,17 +18,63 @@ class TestConnection:
         assert client is not None
         assert client._client is not None
 
-    def test_connection_closure(self):
-        """Test closing MongoDB connection."""
-        # Create a new store instance and manually connect and close
-        config = utils.get_config().get("nosql_store")
-        store = NoSQLStore(config=config)
-        store._connect()
-        store._close()
-        # Since _close() does not return anything, we assume success if no exception is raised
-        assert True
-
-    @pytest.mark.timeout(3)
+    def test_connection_closure(self, _shared_store):
+        """Test closing MongoDB connection and reopening it on the same store."""
+        _shared_store._close()
+        try:
+            assert not _shared_store.is_connected
+        finally:
+            # Reconnect so the rest of the session keeps its store
+            _shared_store._connect()
+        assert _shared_store.is_connected
+        assert _shared_store.client._client is not None
+
+    def test_connection_shared_client(self, nosql_config, collection_name):
+        """Test that stores with the same configuration share one MongoClient.
+
+        The stores use a timeout no other store in the session uses, so they
+        hold every reference to their cache key and the last close evicts it.
+        """
+        connection_config = nosql_config["connection"]
+        timeout = connection_config.get("connection_timeout", 30) + 0.5
+        config = {
+            **nosql_config,
+            "connection": {**connection_config, "connection_timeout": timeout},
+        }
+        store1 = NoSQLStore(config=config)
+        store2 = NoSQLStore(config=config)
+        store1._connect()
+        store2._connect()
+        client = store1.client._client
+        key = store1.client._client_key
+        cache = type(store1.client)._client_cache
+        try:
+            assert store2.client._client is client
+            store1._close()
+            # The shared client stays open while another store still uses it
+            assert cache[key] is client
+            assert store2.find(collection_name, limit=1) is not None
+        finally:
+            store2._close()
+
+        # Releasing the last reference evicts and closes the shared client
+        assert key not in cache
+        with pytest.raises(pymongo.errors.InvalidOperation):
+            client.admin.command("ping")
+
+    def test_connection_force_new_client(self, nosql_config):
+        """Test that force_new bypasses the shared MongoClient."""
+        store1 = NoSQLStore(config=nosql_config)
+        store2 = NoSQLStore(config=nosql_config)
+        store1._connect()
+        store2._connect(force_new=True)
+        try:
+            assert store1.client._client is not store2.client._client
+        finally:
+            store1._close()
+            store2._close()
+
+    @pytest.mark.timeout(1)
     def test_connection_fail(self):
         """Test connection failure with invalid host configuration."""
         bad_config = {
@@ -38,12 +84,11 @@ class TestConnection:
                 "port": 27017,
                 "username": "invalid_user",
                 "password": "invalid_pass",
-                "connection_timeout": 1,  # Short timeout for testing
+                "connection_timeout": 0.3,  # Short timeout for testing
             },
         }
+        store = NoSQLStore(config=bad_config)
         with pytest.raises(RuntimeError) as excinfo:
-            store = NoSQLStore(config=bad_config.get("nosql_store", bad_config))
             store._connect()
-            store._close()
         # Check for timeout error message in exception
         assert "timeout" in str(excinfo.value).lower()
@@ -0,0 +1,33 @@
+"""Shared assertions for object store tests."""
+
+from urllib.parse import parse_qs, urlsplit
+
+# Query parameters every AWS Signature V4 presigned URL carries
+REQUIRED_AMZ = frozenset(
+    {
+        "X-Amz-Algorithm",
+        "X-Amz-Credential",
+        "X-Amz-Date",
+        "X-Amz-Expires",
+        "X-Amz-SignedHeaders",
+        "X-Amz-Signature",
+    }
+)
+
+
+def assert_presigned(url: str, base: str, expires: int | None = None) -> None:
+    """Assert that a URL is a presigned URL for the given object.
+
+    Args:
+        url: Presigned URL returned by the object store
+        base: Expected scheme, host and object path the URL starts with
+        expires: Expected expiry in seconds, not checked when None
+    """
+    assert isinstance(url, str)
+    assert url.startswith(base)
+
+    query = parse_qs(urlsplit(url).query)
+    missing = REQUIRED_AMZ - query.keys()
+    assert not missing, f"Presigned URL is missing {sorted(missing)}"
+    if expires is not None:
+        assert query["X-Amz-Expires"] == [str(expires)]
@@ -1,16 +1,41 @@
+import hashlib
 import os
-import tempfile
+import types
 
 import pytest
 import requests
 
 from data_store.object_store import ObjectStore
+from data_store.object_store import store as store_module
 
+from ._helpers import assert_presigned
 
-@pytest.fixture
+# Object keys, prefixed per xdist worker so workers don't share objects
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "master")
+TEST_KEY = f"test_presigned_urls/{_WORKER}/test-file.txt"
+TEST_UPLOAD_KEY = f"test_presigned_urls/{_WORKER}/test-upload-file.txt"
+
+
+@pytest.fixture(scope="module")
+def object_store_lightweight():
+    """Create an ObjectStore instance without uploading any test data.
+
+    Presigned URLs are signed locally, so format checks don't need the
+    object to exist.
+
+    Returns:
+        ObjectStore: Configured ObjectStore instance for testing
+    """
+    return ObjectStore()
+
+
+@pytest.fixture(scope="module")
 def object_store():
     """Create an ObjectStore instance with real configuration.
 
+    The test object is uploaded once and shared by the tests that fetch it
+    over HTTP; tests that upload use their own keys.
+
     Yields:
         ObjectStore: Configured ObjectStore instance for testing
     """
@@ -18,21 +43,15 @@ def object_store():
     store = ObjectStore()
 
     # Setup test data
-    test_key = "test_presigned_urls/test-file.txt"
+    test_key = TEST_KEY
     test_content = b"This is a test file for presigned URL testing"
 
-    # Create a temporary file with test content
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(test_content)
-        temp_file_path = temp_file.name
+    # Upload test content straight from memory, no temporary file needed
+    store.put_object_v2(data=test_content, key=test_key, length=len(test_content))
 
     try:
-        # Upload test file to the object store
-        store.upload_object(file_path=temp_file_path, key=test_key)
         yield store
     finally:
-        # Clean up the temporary file from local filesystem
-        os.unlink(temp_file_path)
         # Teardown test data
         try:
             store.delete_object(key=test_key)
@@ -41,135 +60,160 @@ def object_store():
             print(f"Warning: Failed to cleanup test file {test_key}: {e}")
 
 
+@pytest.fixture(scope="module")
+def http():
+    """Share one HTTP session so presigned URL requests reuse a connection.
+
+    Yields:
+        requests.Session: Keep-alive session for requests to the object store
+    """
+    with requests.Session() as session:
+        yield session
+
+
 class BasePresignedUrlTest:
-    test_key = "test_presigned_urls/test-file.txt"
+    test_key = TEST_KEY
     test_content = b"This is a test file for presigned URL testing"
 
     """Base class for presigned URL tests with common setup and teardown."""
 
 
+@pytest.fixture(scope="class")
+def signed_urls(object_store_lightweight):
+    """Sign the URLs checked by the format tests once per class.
+
+    Signing is local HMAC work, so the URLs are built back to back here and
+    each test picks the one it checks.
+
+    Returns:
+        dict[str, str]: Presigned URLs keyed by the variant they exercise
+    """
+    return {
+        "get": object_store_lightweight.get_presigned_url(TEST_KEY),
+        "get_7200": object_store_lightweight.get_presigned_url(TEST_KEY, expires=7200),
+        "put": object_store_lightweight.get_presigned_upload_url(TEST_UPLOAD_KEY),
+    }
+
+
 class TestPresignedUrlFormat(BasePresignedUrlTest):
     """Test suite for presigned URL format validation."""
 
-    def test_get_presigned_url_default_bucket_format(self, object_store):
+    def test_get_presigned_url_default_bucket_format(self, signed_urls):
         """Test that presigned URLs have the expected format with default bucket.
 
         Args:
-            object_store: ObjectStore instance for testing
+            signed_urls: Presigned URLs signed once for this class
         """
         # Arrange
         key = self.test_key
 
         # Act
-        url = object_store.get_presigned_url(key)
+        url = signed_urls["get"]
 
         # Assert
-        assert isinstance(url, str)
-        assert f"http://192.168.0.100:9000/sandbox/{key}" in url
-
-        # Verify the URL contains expected query parameters
-        assert "X-Amz-Algorithm" in url
-        assert "X-Amz-Credential" in url
-        assert "X-Amz-Date" in url
-        assert "X-Amz-Expires" in url
-        assert "X-Amz-SignedHeaders" in url
-        assert "X-Amz-Signature" in url
-
-    def test_get_presigned_url_with_expiry_format(self, object_store):
+        assert_presigned(url, f"http://192.168.0.100:9000/sandbox/{key}")
+
+    def test_get_presigned_url_with_expiry_format(self, signed_urls):
         """Test that presigned URLs have the expected format with custom expiry.
 
         Args:
-            object_store: ObjectStore instance for testing
+            signed_urls: Presigned URLs signed once for this class
+        """
+        # Arrange
+        key = self.test_key
+
+        # Act
+        url = signed_urls["get_7200"]
+
+        # Assert
+        assert_presigned(url, f"http://192.168.0.100:9000/sandbox/{key}", expires=7200)
+
+    def test_get_presigned_url_is_reused(self, object_store_lightweight, monkeypatch):
+        """Test that repeated presigned URL requests reuse the signed URL.
+
+        Args:
+            object_store_lightweight: ObjectStore instance without test data
+            monkeypatch: Pins the store's clock so both calls share a window
         """
         # Arrange
         key = self.test_key
-        expires = 7200  # 2 hours
+        monkeypatch.setattr(
+            store_module, "time", types.SimpleNamespace(time=lambda: 1_000_000.0)
+        )
 
         # Act
-        url = object_store.get_presigned_url(key, expires=expires)
+        first_url = object_store_lightweight.get_presigned_url(key, expires=7200)
+        second_url = object_store_lightweight.get_presigned_url(key, expires=7200)
 
         # Assert
-        assert isinstance(url, str)
-        assert f"http://192.168.0.100:9000/sandbox/{key}" in url
-
-        # Verify the URL contains expected query parameters
-        assert "X-Amz-Algorithm" in url
-        assert "X-Amz-Credential" in url
-        assert "X-Amz-Date" in url
-        assert "X-Amz-Expires=7200" in url
-        assert "X-Amz-SignedHeaders" in url
-        assert "X-Amz-Signature" in url
-
-    def test_presigned_upload_url_format(self, object_store):
+        assert second_url == first_url
+
+    def test_presigned_upload_url_format(self, signed_urls):
         """Test that presigned upload URLs have the expected format.
 
         Args:
-            object_store: ObjectStore instance for testing
+            signed_urls: Presigned URLs signed once for this class
         """
         # Arrange
-        key = "test_presigned_urls/test-upload-file.txt"
+        key = TEST_UPLOAD_KEY
 
         # Act
-        url = object_store.get_presigned_upload_url(key)
+        url = signed_urls["put"]
 
         # Assert
-        assert url.startswith(f"http://192.168.0.100:9000/sandbox/{key}")
-        assert "X-Amz-Algorithm" in url
-        assert "X-Amz-Credential" in url
-        assert "X-Amz-Date" in url
-        assert "X-Amz-Expires" in url
-        assert "X-Amz-SignedHeaders" in url
-        assert "X-Amz-Signature" in url
+        assert_presigned(url, f"http://192.168.0.100:9000/sandbox/{key}")
 
 
+@pytest.mark.slow
 class TestPresignedUrlUtilities(BasePresignedUrlTest):
     """Test suite for presigned URL utility functionality."""
 
-    def test_presigned_upload(self, object_store):
+    def test_presigned_upload(self, object_store, http):
         """Test that presigned upload URLs work correctly for file uploads.
 
         Args:
             object_store: ObjectStore instance for testing
+            http: Shared HTTP session for requests to the object store
         """
         # Arrange
-        key = "test_presigned_urls/test-upload-file.txt"
+        key = TEST_UPLOAD_KEY
         test_content = b"This is a test file for presigned upload URL testing"
         url = object_store.get_presigned_upload_url(key)
 
         # Act
-        response = requests.put(url, data=test_content)
+        response = http.put(url, data=test_content)
 
         # Assert
         assert response.status_code == 200, (
             f"Failed to upload file using presigned URL: {response.text}"
         )
 
-        # Check if the file exists in the object store
-        test_object = object_store.get_object(key)
-        assert test_object is not None, (
-            "Uploaded file does not exist in the object store"
-        )
-
-        test_object_content = test_object.body
-        assert test_object_content == test_content, (
-            "Content of the uploaded file does not match the original content"
-        )
+        # A single-part upload's ETag is the MD5 of its content, so a HEAD
+        # request verifies it without downloading the object again
+        metadata = object_store.stat_object(key)
+        assert metadata.size == len(test_content)
+        if metadata.etag != hashlib.md5(test_content).hexdigest():
+            # ETag isn't a plain MD5 (e.g. server-side encryption), compare bodies
+            assert object_store.get_object(key).body == test_content, (
+                "Content of the uploaded file does not match the original content"
+            )
 
         # Clean up the uploaded file
         object_store.delete_object(key)
 
-    def test_presigned_url_get(self, object_store):
+    def test_presigned_url_get(self, object_store, http):
         """Test that presigned URLs can be used to access objects.
 
         Args:
             object_store: ObjectStore instance for testing
+            http: Shared HTTP session for requests to the object store
         """
         # Arrange
         key = self.test_key
         url = object_store.get_presigned_url(key)
 
         # Act
-        response = requests.get(url)
+        response = http.get(url)
 
         # Assert
         assert response.status_code == 200, (